@@ -1,15 +1,22 @@
 """AI Logic."""
 
+import functools
+import hashlib
 from enum import Enum
-import json as j
 
 import guidance
+import orjson
 from guidance import assistant, gen, image, json, system, user
 from guidance.models import Model
-from guidance.models._openai_base import ContentMessage
-from pydantic import BaseModel, ConfigDict
+from guidance.models._openai_base import (
+    ContentMessage,
+    ImageUrlContent,
+    ImageUrlContentInner,
+    TextContent,
+)
+from pydantic import BaseModel, ConfigDict, model_validator
 
-from .fastform import Form
+from .fastform import AnyOfJsonSchema, Form
 
 SYSTEM_PROMPT = """You are a helpful assistant for the FastForm application.
 Your task is to assist users in creating and modifying forms based on their requests.
@@ -35,6 +42,22 @@ on the conversation with the user.
 """
 
 
+@functools.lru_cache(maxsize=256)
+def build_fill_system(form_structure: str) -> str:
+    """Render the FastFill system prompt for a form structure.
+
+    Threads started on the same annotation get the identical prompt string back,
+    which also keeps the prompt prefix stable for provider-side prompt caching.
+
+    Args:
+        form_structure: The JSON structure of the form to fill.
+
+    Returns:
+        The rendered system prompt.
+    """
+    return SYSTEM_PROMPT_FILL.format(form_structure=form_structure)
+
+
 class Response(Enum):
     """Enumeration for AI responses."""
 
@@ -42,133 +65,133 @@ class Response(Enum):
     no = "no"
 
 
-class YesNo(BaseModel):
-    """Simple Yes/No model for JSON responses."""
+class ChatResponse(BaseModel):
+    """Structured response produced by a single chat turn.
+
+    `form` carries the generated or filled form when `selection` is yes and is null
+    otherwise. `message` is the commentary shown to the user either way.
+    """
 
     model_config = ConfigDict(extra="forbid")
     selection: Response
+    form: Form | None
+    message: str
+
+    @model_validator(mode="after")
+    def normalize_form(self) -> "ChatResponse":
+        # The JSON schema sent to the provider cannot tie form to selection, so a
+        # schema-valid reply may disagree with itself. A missing form means no form
+        # was produced, and a form sent alongside no is ignored.
+        if self.form is None:
+            self.selection = Response.no
+        elif self.selection is Response.no:
+            self.form = None
+        return self
+
+
+# Generated once; pydantic does not cache model_json_schema() between calls
+RESPONSE_SCHEMA = ChatResponse.model_json_schema(schema_generator=AnyOfJsonSchema)
+
+
+BUILD_INSTRUCTION = """\
+Now I will analyze the user's request to determine if they are asking to create
+a new form or modify an existing one, and answer with a single JSON object.
+If they are, I will set selection to yes, put the complete form structure in form
+and add commentary on the form in message without repeating the structure itself.
+If not, I will set selection to no, set form to null and continue the conversation
+as usual in message.
+"""
 
+FILL_INSTRUCTION = """\
+Now I will analyze the user's request to determine if they are asking to fill out
+a form based on the provided form structure, and answer with a single JSON object.
+If they are, I will set selection to yes, put the filled form in form and add
+commentary on the filled form in message without repeating the form itself.
+If not, I will set selection to no, set form to null and continue the conversation
+as usual in message.
+"""
 
-def fastformbuild_chat(
-    lm: Model, messages: list[ContentMessage]
-) -> list[ContentMessage]:
-    """Generate a new form based on the user's request.
+
+# Changes whenever any prompt changes, so cached responses are not reused across them
+PROMPT_VERSION = hashlib.sha256(
+    "".join(
+        (SYSTEM_PROMPT, SYSTEM_PROMPT_FILL, BUILD_INSTRUCTION, FILL_INSTRUCTION)
+    ).encode()
+).hexdigest()[:12]
+
+
+def _assistant_message(text: str) -> str:
+    """Serialize text as an assistant ContentMessage.
+
+    The JSON is written straight from the text, matching the message's
+    `model_dump_json()` without building the model first.
+    """
+    return orjson.dumps(
+        {"role": "assistant", "content": [{"type": "text", "text": text}]}
+    ).decode()
+
+
+@functools.cache
+def _response_grammar():
+    """Build the guidance grammar for a ChatResponse once and reuse it.
+
+    `json()` validates its grammar with llguidance every time it is called, so the
+    resulting node is cached rather than rebuilt per request.
+    """
+    return json(name="response", schema=RESPONSE_SCHEMA)
+
+
+def _chat(lm: Model, messages: list[ContentMessage], instruction: str) -> list[str]:
+    """Run a single structured chat turn.
 
     Args:
         lm: The language model to use.
         messages: The messages to use.
+        instruction: The assistant instruction describing the expected response.
 
     Returns:
-        A list of messages.
+        The JSON content of each new assistant message. When a form is returned it
+        is the first of two messages, followed by the commentary.
     """
     lm = lm.copy()
     lm._interpreter.state.messages = messages
 
     with assistant():
-        lm += """\
-        Now I will analyze the user's request to determine if they are asking to create 
-        a new form or modify an existing one.
-        If any of the above is true, I will respond with a JSON object containing
-        the form structure.
-        If not, I will continue with the conversation as usual.
-
-        So, Is the user asking to create a new form or modify an existing one?
-        """
+        lm += instruction
     with assistant():
-        lm += json(name="yes_no", schema=YesNo)
+        lm += _response_grammar()
 
-    selection = j.loads(lm["yes_no"])["selection"]
-    # selection = "yes"
+    response = ChatResponse.model_validate_json(lm["response"])
 
     new_messages = []
-
-    if selection == Response.yes.value:
-        with assistant():
-            lm += "Now I will generate a new form based on the user's request."
-        with assistant():
-            lm += json(name="new_form", schema=Form)
-        with assistant():
-            lm += """\
-        Now I will provide additional commentary/end of message comment on the above 
-        form structure but not repeat the structure itself.
-        """
-        with assistant():
-            lm += gen("message")
-
-        new_messages = [lm._interpreter.state.messages[-2]] + [
-            lm._interpreter.state.get_active_message()
-        ]
-
-    elif selection == Response.no.value:
-        with assistant():
-            lm += """\
-        The user is not asking to create a new form or modify an existing one.
-        I will continue with the conversation as usual.
-        """
-        with assistant():
-            lm += gen("message")
-
-        new_messages = [lm._interpreter.state.get_active_message()]
+    if response.form is not None:
+        new_messages.append(_assistant_message(response.form.model_dump_json()))
+    new_messages.append(_assistant_message(response.message))
 
     return new_messages
 
 
-def fastformfill_chat(
-    lm: Model, messages: list[ContentMessage]
-) -> list[ContentMessage]:
-    """Fill out a form based on the user's request.
+def fastformbuild_chat(lm: Model, messages: list[ContentMessage]) -> list[str]:
+    """Generate a new form based on the user's request.
 
     Args:
         lm: The language model to use.
         messages: The messages to use.
 
     Returns:
-        A list of messages.
+        The JSON content of each new assistant message.
     """
-    lm = lm.copy()
-    lm._interpreter.state.messages = messages
-
-    with assistant():
-        lm += """\
-        Now I will analyze the user's request to determine if they are asking to fill out
-        a form based on the provided form structure.
-        If yes I will respond with a JSON object containing the filled form.
-        If not, I will continue with the conversation as usual.
-        """
-    with assistant():
-        lm += json(name="yes_no", schema=YesNo)
+    return _chat(lm, messages, BUILD_INSTRUCTION)
 
-    selection = j.loads(lm["yes_no"])["selection"]
-    # selection = "yes"
 
-    new_messages = []
+def fastformfill_chat(lm: Model, messages: list[ContentMessage]) -> list[str]:
+    """Fill out a form based on the user's request.
 
-    if selection == Response.yes.value:
-        with assistant():
-            lm += "Now I will generate a filled form based on the user's request."
-        with assistant():
-            lm += json(name="filled_form", schema=Form)
-        with assistant():
-            lm += """\
-        Now I will provide additional commentary/end of message comment on the above 
-        filled form but not repeat the form itself.
-        """
-        with assistant():
-            lm += gen("message")
-
-        new_messages = [lm._interpreter.state.messages[-2]] + [
-            lm._interpreter.state.get_active_message()
-        ]
-
-    elif selection == Response.no.value:
-        with assistant():
-            lm += """\
-        The user is not asking to fill out a form based on the provided form structure.
-        I will continue with the conversation as usual.
-        """
-        with assistant():
-            lm += gen("message")
-
-        new_messages = [lm._interpreter.state.get_active_message()]
+    Args:
+        lm: The language model to use.
+        messages: The messages to use.
 
-    return new_messages
+    Returns:
+        The JSON content of each new assistant message.
+    """
+    return _chat(lm, messages, FILL_INSTRUCTION)
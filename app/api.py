@@ -1,12 +1,17 @@
 """API endpoints."""
 
-import json
-from typing import Generator
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from concurrent.futures import Executor
+from functools import partial
+from typing import TypeVar
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from guidance.models import Model
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from .cache import ResponseCache
 from .models import Annotation, Message, User
 from .schemas import (
     AnnotationCreate,
@@ -27,11 +32,17 @@ from .services import (
     UserService,
 )
 
+logger = logging.getLogger(__name__)
 
-def get_session(request: Request) -> Generator[Session, None, None]:
+ChatResponseT = TypeVar(
+    "ChatResponseT", FastformBuildMessageResponse, FastfillMessageResponse
+)
+
+
+async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Dependency that yields a database session from the application's engine."""
     db_engine = request.app.state.db_engine
-    with Session(db_engine) as session:
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
         yield session
 
 
@@ -40,41 +51,117 @@ def get_models(request: Request) -> dict[str, Model]:
     return request.app.state.models
 
 
-def user_service_dependency(session: Session = Depends(get_session)) -> UserService:
+def get_llm_executor(request: Request) -> Executor:
+    """Dependency to retrieve the LLM call executor from the application state."""
+    return request.app.state.llm_executor
+
+
+def get_response_cache(request: Request) -> ResponseCache:
+    """Dependency to retrieve the chat response cache from the application state."""
+    return request.app.state.response_cache
+
+
+def user_service_dependency(
+    session: AsyncSession = Depends(get_session),
+) -> UserService:
     """Dependency function to inject UserService."""
     return UserService(session)
 
 
 def fastformbuild_service_dependency(
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
+    llm_executor: Executor = Depends(get_llm_executor),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> FastformBuildMessageService:
-    return FastformBuildMessageService(session)
+    return FastformBuildMessageService(session, llm_executor, response_cache)
 
 
 def fastfill_service_dependency(
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
+    llm_executor: Executor = Depends(get_llm_executor),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> FastformBuildMessageService:
     """Dependency function to inject FastformBuildMessageService."""
-    return FastfillMessageService(session)
+    return FastfillMessageService(session, llm_executor, response_cache)
 
 
 def annotation_service_dependency(
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
 ) -> AnnotationService:
     """Dependency function to inject AnnotationService."""
     return AnnotationService(session)
 
 
+def build_chat_response(
+    response_cls: type[ChatResponseT],
+    response_messages: list[Message],
+    cached: bool = False,
+) -> ChatResponseT:
+    """Build a chat response from the messages created for a chat turn.
+
+    Args:
+        response_cls: The response schema to build.
+        response_messages: The messages returned by the service, in order.
+        cached: Whether the model's reply was served from the response cache.
+
+    Returns:
+        The response for the last message, with form data attached when available.
+    """
+    # Take the last message which will be used as the main response
+    last_message = response_messages[-1] if response_messages else None
+    if not last_message:
+        raise HTTPException(status_code=500, detail="No response")
+
+    # Extract form data if available (from first message when 2 messages are returned)
+    form_data = None
+    if len(response_messages) == 2 and response_messages[0].content:
+        try:
+            first_content = orjson.loads(response_messages[0].content)
+        except orjson.JSONDecodeError:
+            logger.exception("Error parsing form data")
+        else:
+            content = first_content.get("content")
+            if content:
+                form_data = content[0].get("text")
+
+    return response_cls(
+        id=last_message.id,
+        content=last_message.content,
+        thread_id=last_message.thread_id,
+        timestamp=last_message.timestamp,
+        user_id=last_message.user_id,
+        form_data=form_data,
+        cached=cached,
+    )
+
+
+async def run_chat(
+    job: Callable[[], Awaitable[tuple[list[Message], bool]]],
+    response_cls: type[ChatResponseT],
+) -> ChatResponseT:
+    """Run a chat job and build its response.
+
+    Args:
+        job: The chat job to run.
+        response_cls: The response schema to build.
+
+    Returns:
+        The chat response.
+    """
+    response_messages, cached = await job()
+    return build_chat_response(response_cls, response_messages, cached)
+
+
 user_router = APIRouter(prefix="/user", tags=["User"])
 
 
 @user_router.get("/{user_id}", response_model=UserResponse, summary="Retrieve a user")
-def read_user(
+async def read_user(
     user_id: str,
     user_service: UserService = Depends(user_service_dependency),
 ) -> User:
     """Retrieve a user by their ID."""
-    return user_service.get_user_by_id(user_id)
+    return await user_service.get_user_by_id(user_id)
 
 
 @user_router.post(
@@ -83,12 +170,12 @@ def read_user(
     status_code=status.HTTP_201_CREATED,
     summary="Create a new user",
 )
-def create_user(
+async def create_user(
     user_data: UserCreate,
     user_service: UserService = Depends(user_service_dependency),
 ) -> User:
     """Create a new user."""
-    return user_service.create_user(user_data)
+    return await user_service.create_user(user_data)
 
 
 @user_router.put(
@@ -96,24 +183,24 @@ def create_user(
     response_model=UserResponse,
     summary="Update an existing user",
 )
-def update_user(
+async def update_user(
     user_id: str,
     user_data: UserUpdate,
     user_service: UserService = Depends(user_service_dependency),
 ) -> User:
     """Update an existing user."""
-    return user_service.update_user(user_id, user_data)
+    return await user_service.update_user(user_id, user_data)
 
 
 @user_router.delete(
     "/{user_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a user"
 )
-def delete_user(
+async def delete_user(
     user_id: str,
     user_service: UserService = Depends(user_service_dependency),
 ):
     """Delete a user by their ID."""
-    user_service.delete_user(user_id)
+    await user_service.delete_user(user_id)
 
 
 annotation_router = APIRouter(prefix="/annotation", tags=["Annotation"])
@@ -124,12 +211,12 @@ annotation_router = APIRouter(prefix="/annotation", tags=["Annotation"])
     response_model=AnnotationResponse,
     summary="Retrieve an annotation",
 )
-def read_annotation(
+async def read_annotation(
     annotation_id: int,
     annotation_service: AnnotationService = Depends(annotation_service_dependency),
 ) -> Annotation:
     """Retrieve an annotation by its ID."""
-    return annotation_service.get_annotation_by_id(annotation_id)
+    return await annotation_service.get_annotation_by_id(annotation_id)
 
 
 @annotation_router.get(
@@ -137,14 +224,14 @@ def read_annotation(
     response_model=list[AnnotationResponse],
     summary="List annotations by user",
 )
-def list_annotations_by_user(
+async def list_annotations_by_user(
     user_id: str,
     skip: int = 0,
     limit: int = 100,
     annotation_service: AnnotationService = Depends(annotation_service_dependency),
 ) -> list[Annotation]:
     """List all annotations created by a specific user."""
-    return annotation_service.list_annotations_by_user(user_id, skip, limit)
+    return await annotation_service.list_annotations_by_user(user_id, skip, limit)
 
 
 @annotation_router.post(
@@ -153,12 +240,12 @@ def list_annotations_by_user(
     status_code=status.HTTP_201_CREATED,
     summary="Create a new annotation",
 )
-def create_annotation(
+async def create_annotation(
     annotation_data: AnnotationCreate,
     annotation_service: AnnotationService = Depends(annotation_service_dependency),
 ) -> Annotation:
     """Create a new annotation."""
-    return annotation_service.create_annotation(annotation_data)
+    return await annotation_service.create_annotation(annotation_data)
 
 
 @annotation_router.put(
@@ -166,13 +253,13 @@ def create_annotation(
     response_model=AnnotationResponse,
     summary="Update an existing annotation",
 )
-def update_annotation(
+async def update_annotation(
     annotation_id: int,
     annotation_data: AnnotationUpdate,
     annotation_service: AnnotationService = Depends(annotation_service_dependency),
 ) -> Annotation:
     """Update an existing annotation."""
-    return annotation_service.update_annotation(annotation_id, annotation_data)
+    return await annotation_service.update_annotation(annotation_id, annotation_data)
 
 
 @annotation_router.delete(
@@ -180,12 +267,12 @@ def update_annotation(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete an annotation",
 )
-def delete_annotation(
+async def delete_annotation(
     annotation_id: int,
     annotation_service: AnnotationService = Depends(annotation_service_dependency),
 ):
     """Delete an annotation by its ID."""
-    annotation_service.delete_annotation(annotation_id)
+    await annotation_service.delete_annotation(annotation_id)
 
 
 fastformbuild_router = APIRouter(prefix="/fastformbuild", tags=["FastformBuild"])
@@ -196,7 +283,7 @@ fastformbuild_router = APIRouter(prefix="/fastformbuild", tags=["FastformBuild"]
     response_model=FastformBuildMessageResponse,
     summary="Send a chat message to FastformBuild and get a response",
 )
-def fastformbuild_chat(
+async def fastformbuild_chat(
     message_data: FastformBuildMessageCreate,
     form_pages: list[bytes] | None = None,
     models: dict = Depends(get_models),
@@ -206,30 +293,9 @@ def fastformbuild_chat(
     FastformBuildMessageResponse.
     """
     lm = models["gpt-4o-mini"]
-    response_messages = service.chat(lm, message_data, form_pages)
-
-    # Take the last message which will be used as the main response
-    last_message = response_messages[-1] if response_messages else None
-    if not last_message:
-        raise HTTPException(status_code=500, detail="No response")
-
-    # Extract form data if available (from first message when 2 messages are returned)
-    form_data = None
-    if len(response_messages) == 2:
-        try:
-            first_content = json.loads(response_messages[0].content)
-            if "content" in first_content and len(first_content["content"]) > 0:
-                form_data = first_content["content"][0].get("text")
-        except Exception as e:
-            print(f"Error parsing form data: {e}")
-
-    return FastformBuildMessageResponse(
-        id=last_message.id,
-        content=last_message.content,
-        thread_id=last_message.thread_id,
-        timestamp=last_message.timestamp,
-        user_id=last_message.user_id,
-        form_data=form_data,
+    return await run_chat(
+        partial(service.chat, lm, message_data, form_pages),
+        FastformBuildMessageResponse,
     )
 
 
@@ -238,11 +304,11 @@ def fastformbuild_chat(
     response_model=list[str],
     summary="Get all thread IDs belonging to a user",
 )
-def get_threads_by_user(
+async def get_threads_by_user(
     user_id: str,
     service: FastformBuildMessageService = Depends(fastformbuild_service_dependency),
 ) -> list[int]:
-    return service.get_threads_by_user(user_id)
+    return await service.get_threads_by_user(user_id)
 
 
 @fastformbuild_router.get(
@@ -250,23 +316,12 @@ def get_threads_by_user(
     response_model=list[FastformBuildMessageResponse],
     summary="Get message history for a thread",
 )
-def get_thread_history(
+async def get_thread_history(
     thread_id: str,
     service: FastformBuildMessageService = Depends(fastformbuild_service_dependency),
-):
+) -> list[Message]:
     """Get the message history for a thread by thread_id."""
-    messages = service._get_thread_history(thread_id)
-    return [
-        FastformBuildMessageResponse(
-            id=m.id,
-            content=m.content,
-            thread_id=m.thread_id,
-            timestamp=m.timestamp,
-            user_id=m.user_id,
-            form_data=None,
-        )
-        for m in messages
-    ]
+    return await service._get_thread_history(thread_id)
 
 
 fastfill_router = APIRouter(prefix="/fastfill", tags=["FastFill"])
@@ -277,7 +332,7 @@ fastfill_router = APIRouter(prefix="/fastfill", tags=["FastFill"])
     response_model=FastfillMessageResponse,
     summary="Send a chat message to FastFill and get a response",
 )
-def fastfill_chat(
+async def fastfill_chat(
     message_data: FastfillMessageCreate,
     models: dict = Depends(get_models),
     service: FastfillMessageService = Depends(fastfill_service_dependency),
@@ -286,30 +341,9 @@ def fastfill_chat(
     FastFillMessageResponse.
     """
     lm = models["gpt-4o-mini"]
-    response_messages = service.chat(lm, message_data)
-
-    # Take the last message which will be used as the main response
-    last_message = response_messages[-1] if response_messages else None
-    if not last_message:
-        raise HTTPException(status_code=500, detail="No response")
-
-    # Extract form data if available (from first message when 2 messages are returned)
-    form_data = None
-    if len(response_messages) == 2:
-        try:
-            first_content = json.loads(response_messages[0].content)
-            if "content" in first_content and len(first_content["content"]) > 0:
-                form_data = first_content["content"][0].get("text")
-        except Exception as e:
-            print(f"Error parsing form data: {e}")
-
-    return FastfillMessageResponse(
-        id=last_message.id,
-        content=last_message.content,
-        thread_id=last_message.thread_id,
-        timestamp=last_message.timestamp,
-        user_id=last_message.user_id,
-        form_data=form_data,
+    return await run_chat(
+        partial(service.chat, lm, message_data),
+        FastfillMessageResponse,
     )
 
 
@@ -318,12 +352,12 @@ def fastfill_chat(
     response_model=list[str],
     summary="Get all thread IDs belonging to a user",
 )
-def get_fastfill_threads_by_user(
+async def get_fastfill_threads_by_user(
     user_id: str,
     service: FastfillMessageService = Depends(fastfill_service_dependency),
 ) -> list[int]:
     """Get all thread IDs belonging to a user."""
-    return service.get_threads_by_user(user_id)
+    return await service.get_threads_by_user(user_id)
 
 
 @fastfill_router.get(
@@ -331,34 +365,29 @@ def get_fastfill_threads_by_user(
     response_model=list[FastfillMessageResponse],
     summary="Get message history for a FastFill thread",
 )
-def get_fastfill_thread_history(
+async def get_fastfill_thread_history(
     thread_id: str,
     service: FastfillMessageService = Depends(fastfill_service_dependency),
-):
+) -> list[Message]:
     """Get the message history for a FastFill thread by thread_id."""
-    messages = service._get_thread_history(thread_id)
-    return [
-        FastfillMessageResponse(
-            id=m.id,
-            content=m.content,
-            thread_id=m.thread_id,
-            timestamp=m.timestamp,
-            user_id=m.user_id,
-            form_data=None,
-        )
-        for m in messages
-    ]
+    return await service._get_thread_history(thread_id)
 
 
 v1_router = APIRouter(prefix="/v1")
 
 
 @v1_router.get("/", summary="API root endpoint")
-def api_root() -> dict:
+async def api_root() -> dict:
     """Root endpoint for the API."""
     return {"message": "FastForm API", "version": "v1"}
 
 
+@v1_router.get("/metrics", summary="Service metrics")
+async def metrics(cache: ResponseCache = Depends(get_response_cache)) -> dict:
+    """Return runtime metrics, including response cache hit rate."""
+    return {"response_cache": cache.stats()}
+
+
 v1_router.include_router(user_router)
 v1_router.include_router(annotation_router)
 v1_router.include_router(fastformbuild_router)
@@ -0,0 +1,88 @@
+"""Response caching for the chat endpoints."""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from cachetools import TTLCache
+
+
+def digest_chunks(chunks: Iterable[bytes]) -> str:
+    """Compute a SHA-256 digest over a sequence of byte strings.
+
+    Each chunk is length-prefixed, so different splits of the same bytes do not
+    collide.
+
+    Args:
+        chunks: The chunks to digest.
+
+    Returns:
+        The hex digest.
+    """
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(len(chunk).to_bytes(8, "big"))
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """LRU cache with per-entry TTL, keyed by a SHA-256 digest of the request.
+
+    The cache is only accessed from the event loop, so no locking is needed.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: int = 3600):
+        self._cache: TTLCache[str, Any] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a cache key from JSON-serializable request parts.
+
+        Args:
+            parts: The parts identifying the request.
+
+        Returns:
+            The SHA-256 hex digest of the canonical JSON encoding of `parts`.
+        """
+        encoded = json.dumps(parts, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Look up a cached value, recording a hit or a miss.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        value = self._cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value in the cache.
+
+        Args:
+            key: The cache key.
+            value: The value to store.
+        """
+        self._cache[key] = value
+
+    def stats(self) -> dict[str, int | float]:
+        """Return cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._cache),
+            "maxsize": int(self._cache.maxsize),
+        }
@@ -3,6 +3,14 @@ settings.
 """
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import make_url
+
+# Async drivers used for each database dialect
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+psycopg",
+    "postgres": "postgresql+psycopg",
+}
 
 
 class APIKeys(BaseSettings):
@@ -23,6 +31,27 @@ class DatabaseConfig(BaseSettings):
     # Default to SQLite for containerized deployment
     url: str = "sqlite:///./fastform.db"
     pool_kwargs: dict[str, str | int | bool] | None = None
+    # Connection pool sizing; connections are checked before use and recycled before
+    # servers or proxies drop them as idle
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_pre_ping: bool = True
+    pool_recycle: int = 1800
+    # Applied to every new connection when the database is SQLite. WAL lets readers
+    # proceed while a write is in progress.
+    sqlite_pragmas: dict[str, str | int] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "mmap_size": 268435456,
+    }
+
+    @property
+    def async_url(self) -> str:
+        """Database URL rewritten to use the async driver for its dialect."""
+        url = make_url(self.url)
+        drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+        return url.set(drivername=drivername).render_as_string(hide_password=False)
 
 
 class AppConfig(BaseSettings):
@@ -45,3 +74,30 @@ class AppConfig(BaseSettings):
     # Production
     docs_enabled: bool = False
     dev_mode: bool = False
+
+
+class LLMConfig(BaseSettings):
+    """Language model serving configuration loaded from environment variables."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", env_prefix="LLM_", extra="allow"
+    )
+
+    # Worker threads for blocking guidance calls; bounds concurrent provider requests
+    concurrency: int = 64
+
+    # Provider HTTP transport
+    http2: bool = True
+    max_connections: int = 200
+    max_keepalive_connections: int = 100
+
+
+class CacheConfig(BaseSettings):
+    """Response cache configuration loaded from environment variables."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", env_prefix="CACHE_", extra="allow"
+    )
+
+    maxsize: int = 10_000
+    ttl: int = 3600
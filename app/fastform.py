@@ -1,7 +1,7 @@
 """Fastform Schema Definitions."""
 
 from enum import Enum
-from typing import Generic, TypeVar
+from typing import Annotated, Generic, Literal, TypeVar
 
 from pydantic import (
     BaseModel as PydanticBaseModel,
@@ -12,6 +12,8 @@ from pydantic import (
     field_validator,
     model_validator,
 )
+from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
+from pydantic_core import core_schema
 
 FORBID_EXTRA = {"extra": "forbid"}
 SET_TO_NULLV = "This field is to be set to null. The frontend will fill it in later."
@@ -19,6 +21,24 @@ SET_TO_NULLV = "This field is to be set to null. The frontend will fill it in la
 t = TypeVar("t", bound="Annotation")
 
 
+class AnyOfJsonSchema(GenerateJsonSchema):
+    """JSON schema generator that renders discriminated unions as plain `anyOf`.
+
+    Pydantic emits `oneOf` plus an OpenAPI `discriminator` for tagged unions, neither
+    of which is accepted by strict structured-output APIs. Each union member already
+    pins `element_name` to a single value, so `anyOf` is equivalent.
+    """
+
+    def tagged_union_schema(
+        self, schema: core_schema.TaggedUnionSchema
+    ) -> JsonSchemaValue:
+        json_schema = super().tagged_union_schema(schema)
+        json_schema.pop("discriminator", None)
+        if "oneOf" in json_schema:
+            json_schema["anyOf"] = json_schema.pop("oneOf")
+        return json_schema
+
+
 class BaseModel(PydanticBaseModel):
     """Base class that forbids undeclared attributes by default.
 
@@ -46,7 +66,7 @@ class Coordinate(BaseModel):
     y: int | None = Field(..., description="Y coordinate" + SET_TO_NULLV)
 
 
-class AnnotationEnum(Enum):
+class AnnotationEnum(str, Enum):
     """Enumeration for annotation types.
 
     This is used to identify the type of annotation in the form schema.
@@ -102,6 +122,7 @@ class TextField(Annotation):
     Inherits title, description, bbox. Agent sets `value` to null; frontend fills in.
     """
 
+    element_name: Literal[AnnotationEnum.text_field]
     value: str | None = Field(..., description="Text value" + SET_TO_NULLV)
 
 
@@ -111,6 +132,7 @@ class TextAreaField(Annotation):
     Supports a maximum character length. Useful for comments or long-form input.
     """
 
+    element_name: Literal[AnnotationEnum.text_area_field]
     value: str | None = Field(..., description="Multiline text value" + SET_TO_NULLV)
     max_length: int | None = Field(..., description="Optional maximum characters")
 
@@ -121,6 +143,7 @@ class NumberField(Annotation):
     Optionally constrain with min_value and max_value.
     """
 
+    element_name: Literal[AnnotationEnum.number_field]
     value: int | float | None = Field(..., description="Numeric value" + SET_TO_NULLV)
     min_value: int | float | None = Field(..., description="Minimum value")
     max_value: int | float | None = Field(..., description="Maximum value")
@@ -129,18 +152,21 @@ class NumberField(Annotation):
 class DateField(Annotation):
     """Date picker field (ISO 8601 format YYYY-MM-DD)."""
 
+    element_name: Literal[AnnotationEnum.date_field]
     value: str | None = Field(..., description="ISO 8601 date" + SET_TO_NULLV)
 
 
 class CheckboxField(Annotation):
     """Boolean checkbox field."""
 
+    element_name: Literal[AnnotationEnum.checkbox_field]
     value: bool | None = Field(..., description="Checked or not" + SET_TO_NULLV)
 
 
 class RadioField(Annotation):
     """Single-choice option group (radio buttons)."""
 
+    element_name: Literal[AnnotationEnum.radio_field]
     options: list[str] = Field(..., description="Option labels")
     value: str | None = Field(..., description="Selected option" + SET_TO_NULLV)
 
@@ -155,6 +181,7 @@ class SelectOption(BaseModel):
 class SelectField(Annotation):
     """Dropdown field supporting single or multiple selections."""
 
+    element_name: Literal[AnnotationEnum.select_field]
     options: list[SelectOption] = Field(..., description="Available options")
     multi: bool = Field(..., description="Allow multiple selections?")
     value: list[SelectOption] | SelectOption | None = Field(
@@ -162,19 +189,19 @@ class SelectField(Annotation):
     )
 
     @model_validator(mode="after")
-    def check_select(cls, values: dict[str, object]) -> dict[str, object]:
-        multi = values.get("multi")
-        val = values.get("value")
-        if multi and val is not None and not isinstance(val, list):
-            raise ValueError("When multi=True, value must be a list")
-        if not multi and isinstance(val, list):
+    def check_select(self) -> "SelectField":
+        if self.multi:
+            if self.value is not None and not isinstance(self.value, list):
+                raise ValueError("When multi=True, value must be a list")
+        elif isinstance(self.value, list):
             raise ValueError("When multi=False, value must be a single item")
-        return values
+        return self
 
 
 class FileField(Annotation):
     """Generic file upload field."""
 
+    element_name: Literal[AnnotationEnum.file_field]
     allowed: list[str] = Field(..., description="Allowed MIME types")
     max_mb: int | None = Field(..., description="Max file size in MB")
     value: str | None = Field(..., description="File ID or URI" + SET_TO_NULLV)
@@ -183,6 +210,7 @@ class FileField(Annotation):
 class ImageField(FileField):
     """Specialized FileField for images (JPEG, PNG, WEBP)."""
 
+    element_name: Literal[AnnotationEnum.image_field]
     allowed: list[str] = Field(
         ...,
         description="Image references." + SET_TO_NULLV,
@@ -192,34 +220,62 @@ class ImageField(FileField):
 class SignatureField(Annotation):
     """Field for capturing hand-drawn signatures as Data URIs."""
 
+    element_name: Literal[AnnotationEnum.signature_field]
     value: str | None = Field(..., description="Signature as dataURI" + SET_TO_NULLV)
 
 
 class EmailField(Annotation):
     """Email input (string, validated on frontend)."""
 
+    element_name: Literal[AnnotationEnum.email_field]
     value: str | None = Field(..., description="Email address" + SET_TO_NULLV)
 
 
 class UrlField(Annotation):
     """URL input (string, validated on frontend)."""
 
+    element_name: Literal[AnnotationEnum.url_field]
     value: str | None = Field(..., description="URL" + SET_TO_NULLV)
 
 
 class PhoneField(Annotation):
     """International phone number input (E.164 format)."""
 
+    element_name: Literal[AnnotationEnum.phone_field]
     value: str | None = Field(..., description="Phone number" + SET_TO_NULLV)
 
 
 class ListField(Annotation, Generic[t]):
     """Collection of repeating annotations (e.g., multiple addresses)."""
 
+    element_name: Literal[AnnotationEnum.list_field]
     items: list[t] | None = Field(..., description="Items list" + SET_TO_NULLV)
 
 
-class AnnotationGroupEnum(Enum):
+# Every field annotation type; the group and form unions below are built from it,
+# so a new field type is added here only
+AnnotationType = (
+    TextField
+    | TextAreaField
+    | NumberField
+    | DateField
+    | CheckboxField
+    | RadioField
+    | SelectField
+    | FileField
+    | ImageField
+    | SignatureField
+    | EmailField
+    | UrlField
+    | PhoneField
+    | ListField[t]
+)
+
+# Unions are dispatched on `element_name` instead of trying each member
+AnyAnnotation = Annotated[AnnotationType, Field(discriminator="element_name")]
+
+
+class AnnotationGroupEnum(str, Enum):
     """Enumeration for annotation group types.
 
     This is used to identify the type of annotation group in the form schema.
@@ -245,7 +301,7 @@ class AnnotationGroup(BaseModel):
 
     title: str
     description: str
-    annotations: list[Annotation] = Field(
+    annotations: list[AnyAnnotation] = Field(
         ..., min_length=1, description="Contained annotations"
     )
     element_name: AnnotationGroupEnum
@@ -254,6 +310,7 @@ class AnnotationGroup(BaseModel):
 class SectionGroup(AnnotationGroup):
     """Logical section of the form that may collapse."""
 
+    element_name: Literal[AnnotationGroupEnum.section_group]
     collapsible: bool
     collapsed: bool
 
@@ -261,6 +318,7 @@ class SectionGroup(AnnotationGroup):
 class RepeatGroup(AnnotationGroup):
     """Repeatable block (e.g., multiple contact methods)."""
 
+    element_name: Literal[AnnotationGroupEnum.repeat_group]
     min_val: int = Field(..., description="Min repeats")
     max_val: int | None = Field(..., description="Max repeats")
 
@@ -268,73 +326,51 @@ class RepeatGroup(AnnotationGroup):
 class WizardStep(AnnotationGroup):
     """Step in a multi-page/wizard form."""
 
+    element_name: Literal[AnnotationGroupEnum.wizard_step]
     order: int | None = Field(..., description="Step index")
     optional: bool
 
 
+# Every group type except tables, which do not nest inside table rows
+GroupType = SectionGroup | RepeatGroup | WizardStep
+
+# A cell of a table row
+AnyRowElement = Annotated[
+    AnnotationType | GroupType, Field(discriminator="element_name")
+]
+
+
 class TableGroup(AnnotationGroup):
     """Tabular layout (rows x columns)."""
 
+    element_name: Literal[AnnotationGroupEnum.table_group]
     columns: list[str]
-    rows: list[
-        list[
-            TextField
-            | TextAreaField
-            | NumberField
-            | DateField
-            | CheckboxField
-            | RadioField
-            | SelectField
-            | FileField
-            | ImageField
-            | SignatureField
-            | EmailField
-            | UrlField
-            | PhoneField
-            | ListField[t]
-            | SectionGroup
-            | RepeatGroup
-            | WizardStep
-        ]
-    ]
+    rows: list[list[AnyRowElement]]
 
     @field_validator("rows", mode="after")
     def match_columns(cls, rows, info):
-        columns = info.data.get("columns", [])
-        for row in rows or []:
-            if len(row) != len(columns):
-                raise ValueError("Row length must equal number of columns")
+        n = len(info.data.get("columns", []))
+        if rows and any(len(row) != n for row in rows):
+            raise ValueError("Row length must equal number of columns")
         return rows
 
 
+# A top-level form element
+AnyElement = Annotated[
+    AnnotationType | GroupType | TableGroup, Field(discriminator="element_name")
+]
+
+
 class Form(BaseModel):
     """Root schema representing an entire form layout for scanned documents."""
 
     title: str
     description: str
-    elements: list[
-        TextField
-        | TextAreaField
-        | NumberField
-        | DateField
-        | CheckboxField
-        | RadioField
-        | SelectField
-        | FileField
-        | ImageField
-        | SignatureField
-        | EmailField
-        | UrlField
-        | PhoneField
-        | ListField[t]
-        | SectionGroup
-        | RepeatGroup
-        | WizardStep
-        | TableGroup
-    ]
+    elements: list[AnyElement]
 
 
 __all__ = [
+    "AnyOfJsonSchema",
     "Coordinate",
     "Annotation",
     "TextField",
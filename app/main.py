@@ -1,20 +1,28 @@
 """Entrypoint."""
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
+import httpx
 from fastapi import APIRouter, Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from guidance.models import Model, OpenAI
-from sqlalchemy.engine.base import Engine
-from sqlmodel import SQLModel, create_engine
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
 
 from .api import v1_router
-from .config import APIKeys, AppConfig, DatabaseConfig
+from .cache import ResponseCache
+from .config import APIKeys, AppConfig, CacheConfig, DatabaseConfig, LLMConfig
 from .models import Annotation, Message, User
 
 app_config = AppConfig()
 keys = APIKeys()
 db_settings = DatabaseConfig()
+llm_config = LLMConfig()
+cache_config = CacheConfig()
 
 
 def setup_cors(app: FastAPI) -> FastAPI:
@@ -35,46 +43,117 @@ def setup_cors(app: FastAPI) -> FastAPI:
     return app
 
 
-def init_models() -> dict[str, Model]:
+def init_http_client() -> httpx.Client:
+    """Create the HTTP client shared by all provider SDK clients.
+
+    With HTTP/2 enabled, concurrent chat requests multiplex over a single TCP/TLS
+    connection instead of queueing on the HTTP/1.1 connection pool.
+
+    Returns:
+        httpx.Client: The shared HTTP client.
+    """
+    return httpx.Client(
+        http2=llm_config.http2,
+        limits=httpx.Limits(
+            max_connections=llm_config.max_connections,
+            max_keepalive_connections=llm_config.max_keepalive_connections,
+        ),
+    )
+
+
+def init_models(http_client: httpx.Client | None = None) -> dict[str, Model]:
     """Load models based on the application settings.
 
+    Args:
+        http_client (httpx.Client | None): HTTP client passed through to the provider
+            SDKs. Defaults to the SDK's own client when None.
     Returns:
         dict[str, Model]: A dictionary mapping model names to their instances.
     """
     models = {}
 
     if keys.openai:
-        models["gpt-4o-mini"] = OpenAI(model="gpt-4o-mini", api_key=keys.openai)
+        models["gpt-4o-mini"] = OpenAI(
+            model="gpt-4o-mini", api_key=keys.openai, http_client=http_client
+        )
 
     return models
 
 
-async def init_db() -> Engine | None:
+def set_sqlite_pragmas(engine: AsyncEngine, pragmas: dict[str, str | int]) -> None:
+    """Apply PRAGMA settings to every new connection of a SQLite engine.
+
+    Args:
+        engine (AsyncEngine): The SQLite engine.
+        pragmas (dict[str, str | int]): PRAGMA names mapped to their values.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+async def create_tables(engine: AsyncEngine, attempts: int = 3) -> None:
+    """Create the tables, tolerating other workers creating them at the same time.
+
+    Every uvicorn worker runs this at startup. `create_all` checks for each table
+    before creating it, so a worker that loses the race fails with "already exists"
+    (or a duplicate key on Postgres' catalog) and succeeds once it checks again.
+
+    Args:
+        engine (AsyncEngine): The engine to create the tables with.
+        attempts (int): How many times to try before giving up.
+    """
+    for attempt in range(attempts):
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(
+                    SQLModel.metadata.create_all,
+                    tables=[Message.__table__, Annotation.__table__, User.__table__],
+                )
+            return
+        except DBAPIError as e:
+            lost_race = "already exists" in str(e) or "duplicate key" in str(e)
+            if not lost_race or attempt == attempts - 1:
+                raise
+
+
+async def init_db() -> AsyncEngine | None:
     """Initialize the database connection and create the necessary tables.
 
     Returns:
-        Engine | None: The SQLAlchemy engine connected to the database, or None if
-            connection fails.
+        AsyncEngine | None: The async SQLAlchemy engine connected to the database, or
+            None if connection fails.
     """
+    engine = None
     try:
         db_url = db_settings.url
         if not db_url:
             print("Warning: Database URL is not set. Skipping database initialization.")
             return None
 
-        engine = create_engine(db_url)
-        # Test the connection
-        engine.connect().close()
-
-        SQLModel.metadata.create_all(
-            engine,
-            tables=[Message.__table__, Annotation.__table__, User.__table__],
+        engine = create_async_engine(
+            db_settings.async_url,
+            pool_size=db_settings.pool_size,
+            max_overflow=db_settings.max_overflow,
+            pool_pre_ping=db_settings.pool_pre_ping,
+            pool_recycle=db_settings.pool_recycle,
         )
+        if engine.dialect.name == "sqlite":
+            set_sqlite_pragmas(engine, db_settings.sqlite_pragmas)
+
+        # Connecting here also tests the connection
+        await create_tables(engine)
         print(f"Database initialized successfully with URL: {db_url}")
         return engine
     except Exception as e:
         print(f"Warning: Failed to initialize database: {e}")
         print("Application will continue without database functionality.")
+        if engine is not None:
+            await engine.dispose()
         return None
 
 
@@ -91,16 +170,32 @@ async def lifespan(app: FastAPI):
         None: This function does not return any value, but it yields control
         to the application during its lifespan.
     """
-    app.state.models = init_models()
+    app.state.http_client = init_http_client()
+    app.state.models = init_models(app.state.http_client)
     app.state.db_engine = await init_db()
+    app.state.llm_executor = ThreadPoolExecutor(
+        max_workers=llm_config.concurrency, thread_name_prefix="llm"
+    )
+    app.state.response_cache = ResponseCache(
+        maxsize=cache_config.maxsize, ttl=cache_config.ttl
+    )
 
     try:
         yield
     finally:
+        if hasattr(app.state, "response_cache"):
+            del app.state.response_cache
+        if hasattr(app.state, "llm_executor"):
+            app.state.llm_executor.shutdown(wait=True)
+            del app.state.llm_executor
         if hasattr(app.state, "db_engine") and app.state.db_engine:
+            await app.state.db_engine.dispose()
             del app.state.db_engine
         if hasattr(app.state, "models"):
             del app.state.models
+        if hasattr(app.state, "http_client"):
+            app.state.http_client.close()
+            del app.state.http_client
 
 
 docs_enabled = app_config.docs_enabled
@@ -109,6 +204,7 @@ app = FastAPI(
     title=app_config.name,
     version=app_config.version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if docs_enabled else None,
     redoc_url="/redoc" if docs_enabled else None,
     openapi_url="/openapi.json" if docs_enabled else None,
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlmodel import Field, SQLModel
+from sqlmodel import Field, Index, SQLModel
 
 
 class User(SQLModel, table=True):
@@ -20,7 +20,12 @@ class User(SQLModel, table=True):
 class Message(SQLModel, table=True):
     """Model for Fastfill chat messages."""
 
+    # Thread history is always read by thread in timestamp order
+    __table_args__ = (Index("ix_message_thread_ts", "thread_id", "timestamp"),)
+
     id: int | None = Field(default=None, primary_key=True)
+    # Always a serialized guidance ContentMessage; rows are parsed back without
+    # validation when a thread is replayed to the model
     content: str = Field(description="Content of the chat message.")
     thread_id: str = Field(
         index=True, description="ID of the thread this message belongs to."
@@ -107,6 +107,10 @@ class FastfillMessageResponse(MessageResponseBase):
             "if applicable. It should be completely filled out with the user's input."
         ),
     )
+    cached: bool = Field(
+        default=False,
+        description="Whether the model's reply was served from the response cache.",
+    )
 
 
 class FastformBuildMessageCreate(MessageCreateBase):
@@ -124,3 +128,7 @@ class FastformBuildMessageResponse(MessageResponseBase):
             "JSON string representing the form data associated with this message."
         ),
     )
+    cached: bool = Field(
+        default=False,
+        description="Whether the model's reply was served from the response cache.",
+    )
@@ -1,19 +1,28 @@
 """Service layer for business logic."""
 
-import base64
-import json
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor
 
+import orjson
+from cachetools import LRUCache, TTLCache
 from fastapi import Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlmodel import bindparam, delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .ai import (
+    PROMPT_VERSION,
     SYSTEM_PROMPT,
-    SYSTEM_PROMPT_FILL,
     ContentMessage,
+    ImageUrlContent,
+    ImageUrlContentInner,
     Model,
+    TextContent,
+    build_fill_system,
     fastformbuild_chat,
     fastformfill_chat,
 )
+from .cache import ResponseCache, digest_chunks
 from .models import Annotation, Message, User
 from .schemas import (
     AnnotationCreate,
@@ -24,14 +33,132 @@ from .schemas import (
     UserUpdate,
 )
 
+BASE64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+PNG_DATA_URL_PREFIX = b"data:image/png;base64,"
+
+# Most messages of a thread sent to the model per turn, system prompt included
+MAX_HISTORY = 50
+
+# Read statements are built once and executed with bound parameters, so each call
+# skips rebuilding the expression and its compiled-cache key
+ANNOTATION_STRUCTURE_STMT = select(Annotation.structure).where(
+    Annotation.id == bindparam("annotation_id")
+)
+ANNOTATIONS_BY_USER_STMT = (
+    select(Annotation)
+    .where(Annotation.user_id == bindparam("user_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+MESSAGES_BY_THREAD_STMT = (
+    select(Message)
+    .where(Message.thread_id == bindparam("thread_id"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+THREAD_HISTORY_STMT = (
+    select(Message)
+    .where(Message.thread_id == bindparam("thread_id"))
+    # Messages created in one commit can share a timestamp; the ID keeps them in
+    # insertion order (e.g. a form before its commentary)
+    .order_by(Message.timestamp, Message.id)
+)
+THREAD_FIRST_MESSAGE_STMT = THREAD_HISTORY_STMT.limit(1)
+THREAD_RECENT_MESSAGES_STMT = (
+    select(Message)
+    .where(
+        Message.thread_id == bindparam("thread_id"),
+        Message.id != bindparam("first_id"),
+    )
+    .order_by(Message.timestamp.desc(), Message.id.desc())
+    .limit(bindparam("limit"))
+)
+USER_THREADS_STMT = (
+    select(Message.thread_id)
+    .where(Message.user_id == bindparam("user_id"), Message.thread_id.is_not(None))
+    .distinct()
+)
+
+# Annotation structures by ID, used to seed FastFill threads. Entries are dropped
+# when the annotation changes here; the TTL bounds staleness across workers.
+_annotation_structures: TTLCache[int, str] = TTLCache(maxsize=512, ttl=60)
+
+
+def _text_size(message: ContentMessage) -> int:
+    """Size of a parsed message for the parse cache: the length of its text."""
+    return sum(len(getattr(item, "text", "")) for item in message.content) or 1
+
+
+# Parsed stored messages by ID, bounded by the total text held (32M characters).
+# Only accessed from the event loop, so no locking is needed.
+_parsed_messages: LRUCache[int, ContentMessage] = LRUCache(
+    maxsize=32 * 1024 * 1024, getsizeof=_text_size
+)
+
+
+def _parse_content(message_id: int | None, content: str) -> ContentMessage:
+    """Parse a stored message, reusing the result on later turns of the thread.
+
+    Stored message content is never modified after insert, so the parsed message
+    can be shared between requests. Messages carrying images are not cached, since
+    their base64 page data can run to megabytes each, and neither are messages that
+    have not been flushed yet and so have no ID.
+
+    The content was serialized from a ContentMessage by this service, so the text
+    and image items it can hold are rebuilt without validation; anything else goes
+    through the validating path.
+
+    Args:
+        message_id: The ID of the stored message, or None if not yet flushed.
+        content: The JSON content of the stored message.
+
+    Returns:
+        The parsed ContentMessage.
+    """
+    message = _parsed_messages.get(message_id)
+    if message is not None:
+        return message
+
+    data = orjson.loads(content)
+    items = []
+    has_images = False
+    for item in data["content"]:
+        if item["type"] == "text":
+            items.append(TextContent.model_construct(**item))
+        elif item["type"] == "image_url":
+            has_images = True
+            items.append(
+                ImageUrlContent.model_construct(
+                    type="image_url",
+                    image_url=ImageUrlContentInner.model_construct(**item["image_url"]),
+                )
+            )
+        else:
+            items = None
+            break
+
+    if items is None:
+        message = ContentMessage.model_validate(data)
+        has_images = any(item.type == "image_url" for item in message.content)
+    else:
+        message = ContentMessage.model_construct(role=data["role"], content=items)
+
+    if (
+        message_id is not None
+        and not has_images
+        and _text_size(message) <= _parsed_messages.maxsize
+    ):
+        _parsed_messages[message_id] = message
+    return message
+
 
 class UserService:
     """Service class for user-related operations."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def get_user_by_id(self, user_id: str) -> User:
+    async def get_user_by_id(self, user_id: str) -> User:
         """Retrieve a user by their ID.
 
         Args:
@@ -40,7 +167,7 @@ class UserService:
         Returns:
             The user with the given ID.
         """
-        user = self.session.get(User, user_id)
+        user = await self.session.get(User, user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -48,7 +175,7 @@ class UserService:
             )
         return user
 
-    def create_user(self, user_data: UserCreate) -> User:
+    async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user.
 
         Args:
@@ -57,7 +184,7 @@ class UserService:
         Returns:
             The newly created user.
         """
-        existing_user = self.session.get(User, user_data.id)
+        existing_user = await self.session.get(User, user_data.id)
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -69,11 +196,11 @@ class UserService:
             email=user_data.email,
         )
         self.session.add(new_user)
-        self.session.commit()
-        self.session.refresh(new_user)
+        await self.session.commit()
+        await self.session.refresh(new_user)
         return new_user
 
-    def update_user(self, user_id: str, user_data: UserUpdate) -> User:
+    async def update_user(self, user_id: str, user_data: UserUpdate) -> User:
         """Update an existing user.
 
         Args:
@@ -83,42 +210,43 @@ class UserService:
         Returns:
             The updated user.
         """
-        existing_user = self.session.get(User, user_id)
+        result = await self.session.exec(
+            update(User)
+            .where(User.id == user_id)
+            .values(email=user_data.email)
+            .returning(User)
+        )
+        existing_user = result.scalar_one_or_none()
         if not existing_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User '{user_id}' not found",
             )
-
-        existing_user.email = user_data.email
-        self.session.add(existing_user)
-        self.session.commit()
-        self.session.refresh(existing_user)
+        await self.session.commit()
         return existing_user
 
-    def delete_user(self, user_id: str) -> None:
+    async def delete_user(self, user_id: str) -> None:
         """Delete a user by their ID.
 
         Args:
             user_id: The ID of the user to delete.
         """
-        user = self.session.get(User, user_id)
-        if not user:
+        result = await self.session.exec(delete(User).where(User.id == user_id))
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User '{user_id}' not found",
             )
-        self.session.delete(user)
-        self.session.commit()
+        await self.session.commit()
 
 
 class AnnotationService:
     """Service class for annotation-related operations."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def get_annotation_by_id(self, annotation_id: int) -> Annotation:
+    async def get_annotation_by_id(self, annotation_id: int) -> Annotation:
         """Retrieve an annotation by its ID.
 
         Args:
@@ -127,7 +255,7 @@ class AnnotationService:
         Returns:
             The annotation with the given ID.
         """
-        annotation = self.session.get(Annotation, annotation_id)
+        annotation = await self.session.get(Annotation, annotation_id)
         if not annotation:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -135,7 +263,30 @@ class AnnotationService:
             )
         return annotation
 
-    def list_annotations_by_user(
+    async def get_annotation_structure(self, annotation_id: int) -> str:
+        """Retrieve only the structure of an annotation, serving repeats from cache.
+
+        Args:
+            annotation_id: The ID of the annotation.
+
+        Returns:
+            The JSON structure of the annotation.
+        """
+        structure = _annotation_structures.get(annotation_id)
+        if structure is None:
+            result = await self.session.exec(
+                ANNOTATION_STRUCTURE_STMT, params={"annotation_id": annotation_id}
+            )
+            structure = result.first()
+            if structure is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Annotation '{annotation_id}' not found",
+                )
+            _annotation_structures[annotation_id] = structure
+        return structure
+
+    async def list_annotations_by_user(
         self, user_id: str, skip: int = 0, limit: int = 100
     ) -> list[Annotation]:
         """List all annotations created by a specific user.
@@ -148,14 +299,13 @@ class AnnotationService:
         Returns:
             A list of annotations created by the user.
         """
-        return self.session.exec(
-            select(Annotation)
-            .where(Annotation.user_id == user_id)
-            .offset(skip)
-            .limit(limit)
-        ).all()
-
-    def create_annotation(self, annotation_data: AnnotationCreate) -> Annotation:
+        result = await self.session.exec(
+            ANNOTATIONS_BY_USER_STMT,
+            params={"user_id": user_id, "skip": skip, "limit": limit},
+        )
+        return result.all()
+
+    async def create_annotation(self, annotation_data: AnnotationCreate) -> Annotation:
         """Create a new annotation.
 
         Args:
@@ -171,57 +321,75 @@ class AnnotationService:
             user_id=annotation_data.user_id,
         )
         self.session.add(new_annotation)
-        self.session.commit()
-        self.session.refresh(new_annotation)
+        await self.session.commit()
+        await self.session.refresh(new_annotation)
         return new_annotation
 
-    def update_annotation(self, annotation_data: AnnotationUpdate) -> Annotation:
+    async def update_annotation(
+        self, annotation_id: int, annotation_data: AnnotationUpdate
+    ) -> Annotation:
         """Update an existing annotation.
 
         Args:
+            annotation_id: The ID of the annotation to update.
             annotation_data: The data for the updated annotation.
 
         Returns:
             The updated annotation.
         """
-        existing_annotation = self.session.get(Annotation, annotation_data.id)
+        result = await self.session.exec(
+            update(Annotation)
+            .where(Annotation.id == annotation_id)
+            .values(
+                name=annotation_data.name,
+                description=annotation_data.description,
+                structure=annotation_data.structure,
+            )
+            .returning(Annotation)
+        )
+        existing_annotation = result.scalar_one_or_none()
         if not existing_annotation:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Annotation '{annotation_data.id}' not found",
+                detail=f"Annotation '{annotation_id}' not found",
             )
-
-        existing_annotation.name = annotation_data.name
-        existing_annotation.description = annotation_data.description
-        existing_annotation.structure = annotation_data.structure
-        self.session.add(existing_annotation)
-        self.session.commit()
-        self.session.refresh(existing_annotation)
+        await self.session.commit()
+        _annotation_structures.pop(annotation_id, None)
         return existing_annotation
 
-    def delete_annotation(self, annotation_id: int) -> None:
+    async def delete_annotation(self, annotation_id: int) -> None:
         """Delete an annotation by its ID.
 
         Args:
             annotation_id: The ID of the annotation to delete.
         """
-        annotation = self.session.get(Annotation, annotation_id)
-        if not annotation:
+        result = await self.session.exec(
+            delete(Annotation).where(Annotation.id == annotation_id)
+        )
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Annotation '{annotation_id}' not found",
             )
-        self.session.delete(annotation)
-        self.session.commit()
+        await self.session.commit()
+        _annotation_structures.pop(annotation_id, None)
 
 
 class MessageService:
     """Service class for message-related operations."""
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: AsyncSession,
+        llm_executor: Executor | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
         self.session = session
+        # Blocking guidance calls run here; None falls back to the loop's default
+        self.llm_executor = llm_executor
+        self.response_cache = response_cache
 
-    def get_message_by_id(self, message_id: int) -> Message:
+    async def get_message_by_id(self, message_id: int) -> Message:
         """Retrieve a message by its ID.
 
         Args:
@@ -230,7 +398,7 @@ class MessageService:
         Returns:
             The message with the given ID.
         """
-        message = self.session.get(Message, message_id)
+        message = await self.session.get(Message, message_id)
         if not message:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -238,7 +406,7 @@ class MessageService:
             )
         return message
 
-    def list_messages_by_thread(
+    async def list_messages_by_thread(
         self, thread_id: str, skip: int = 0, limit: int = 100
     ) -> list[Message]:
         """List all messages in a specific thread.
@@ -251,12 +419,11 @@ class MessageService:
         Returns:
             A list of messages in the thread.
         """
-        return self.session.exec(
-            select(Message)
-            .where(Message.thread_id == thread_id)
-            .offset(skip)
-            .limit(limit)
-        ).all()
+        result = await self.session.exec(
+            MESSAGES_BY_THREAD_STMT,
+            params={"thread_id": thread_id, "skip": skip, "limit": limit},
+        )
+        return result.all()
 
     def _is_valid_base64_image(self, b: bytes) -> bool:
         """Check if the given bytes are valid base64-encoded image data.
@@ -267,15 +434,19 @@ class MessageService:
         Returns:
             True if the bytes are valid base64-encoded image data, False otherwise.
         """
-        try:
-            # Try to decode and re-encode to check validity
-            base64.b64decode(b, validate=True)
-            return True
-        except Exception:
-            return False
+        # Checked against the alphabet instead of decoding, since the page is
+        # embedded in the prompt still encoded. Deleting every alphabet byte in C
+        # leaves only the padding, which must be at most two trailing "=".
+        rest = b.translate(None, BASE64_ALPHABET)
+        return (
+            bool(b)
+            and len(b) % 4 == 0
+            and rest in (b"", b"=", b"==")
+            and b.endswith(rest)
+        )
 
-    def _get_thread_history(self, thread_id: str) -> list[Message]:
-        """Fetch the message history for a thread. Raise 404 if not found.
+    async def _get_thread_history(self, thread_id: str) -> list[Message]:
+        """Fetch the message history for a thread, oldest first. Raise 404 if not found.
 
         Args:
             thread_id: The ID of the thread to fetch the history for.
@@ -283,9 +454,10 @@ class MessageService:
         Returns:
             A list of messages in the thread.
         """
-        thread = self.session.exec(
-            select(Message).where(Message.thread_id == thread_id)
-        ).all()
+        result = await self.session.exec(
+            THREAD_HISTORY_STMT, params={"thread_id": thread_id}
+        )
+        thread = result.all()
         if not thread:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -293,7 +465,92 @@ class MessageService:
             )
         return thread
 
-    def get_threads_by_user(self, user_id: str) -> list[str]:
+    async def _get_chat_history(
+        self, thread_id: str, max_messages: int = MAX_HISTORY
+    ) -> list[Message]:
+        """Fetch the context for a chat turn, oldest first. Raise 404 if not found.
+
+        Only the first message of the thread, which holds the system prompt, and the
+        most recent `max_messages - 1` messages after it are loaded, so long threads
+        do not grow the per-turn query or the prompt without bound.
+
+        Args:
+            thread_id: The ID of the thread to fetch the history for.
+            max_messages: The maximum number of messages to return.
+
+        Returns:
+            A list of messages in the thread.
+        """
+        result = await self.session.exec(
+            THREAD_FIRST_MESSAGE_STMT, params={"thread_id": thread_id}
+        )
+        first = result.first()
+        if first is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Thread '{thread_id}' not found",
+            )
+
+        result = await self.session.exec(
+            THREAD_RECENT_MESSAGES_STMT,
+            params={
+                "thread_id": thread_id,
+                "first_id": first.id,
+                "limit": max_messages - 1,
+            },
+        )
+        recent = result.all()
+        return [first, *reversed(recent)]
+
+    async def _respond(
+        self,
+        chat_fn: Callable[[Model, list[ContentMessage]], list[str]],
+        lm: Model,
+        messages: list[ContentMessage],
+        prompt: list[str],
+    ) -> tuple[list[str], bool]:
+        """Get the assistant replies for a chat turn, from the response cache if possible.
+
+        The cache key covers everything the model sees: the chat function, the prompt
+        version and the JSON of every message sent, system prompt and form pages
+        included. A hit therefore only replays a reply to an identical conversation,
+        and the caller still records the turn in its own thread. The session is rolled
+        back if the model call fails.
+
+        Args:
+            chat_fn: The AI layer function running the turn.
+            lm: The language model to use.
+            messages: The messages to send.
+            prompt: The stored JSON of each message in `messages`.
+
+        Returns:
+            The JSON content of each reply, and whether it came from the cache.
+        """
+        key = None
+        if self.response_cache is not None:
+            key = ResponseCache.make_key(
+                chat=chat_fn.__name__,
+                prompt_version=PROMPT_VERSION,
+                prompt=digest_chunks(content.encode() for content in prompt),
+            )
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                return list(cached), True
+
+        # The AI layer hands back each message's JSON, so it is not serialized again
+        try:
+            replies = await asyncio.get_running_loop().run_in_executor(
+                self.llm_executor, chat_fn, lm, messages
+            )
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        if key is not None:
+            self.response_cache.set(key, tuple(replies))
+        return replies, False
+
+    async def get_threads_by_user(self, user_id: str) -> list[str]:
         """Get all unique thread IDs belonging to a user.
 
         Args:
@@ -302,21 +559,40 @@ class MessageService:
         Returns:
             A list of thread IDs belonging to the user.
         """
-        thread_ids = self.session.exec(
-            select(Message.thread_id).where(Message.user_id == user_id)
-        ).all()
-        return list({tid for tid in thread_ids if tid is not None})
+        result = await self.session.exec(USER_THREADS_STMT, params={"user_id": user_id})
+        return list(result.all())
 
 
 class FastformBuildMessageService(MessageService):
     """Service class for FastformBuild message-related operations."""
 
-    def chat(
+    def _image_content_items(self, form_pages: list[bytes]) -> list[ImageUrlContent]:
+        """Build image content items for the valid base64-encoded form pages.
+
+        Args:
+            form_pages: The base64-encoded pages of the form.
+
+        Returns:
+            A list of image_url content items, skipping invalid pages.
+        """
+        return [
+            ImageUrlContent.model_construct(
+                type="image_url",
+                # Pages are validated base64, so the URL is decoded once as ASCII
+                image_url=ImageUrlContentInner.model_construct(
+                    url=(PNG_DATA_URL_PREFIX + page).decode("ascii")
+                ),
+            )
+            for page in form_pages
+            if self._is_valid_base64_image(page)
+        ]
+
+    async def chat(
         self,
         lm: Model,
         message_data: FastformBuildMessageCreate,
         form_pages: list[bytes] | None = None,
-    ) -> list[Message]:
+    ) -> tuple[list[Message], bool]:
         """Create a new FastformBuild chat message.
 
         Args:
@@ -325,101 +601,96 @@ class FastformBuildMessageService(MessageService):
             form_pages: The pages of the form to use.
 
         Returns:
-            A list of messages.
+            The created assistant messages, and whether the model's reply was served
+            from the response cache.
         """
         thread_id = message_data.thread_id
 
         try:
-            thread = self._get_thread_history(thread_id)
+            thread = await self._get_chat_history(thread_id)
         except HTTPException as e:
             if e.status_code == status.HTTP_404_NOT_FOUND:
                 system_message = Message(
-                    content=json.dumps(
+                    content=orjson.dumps(
                         {
                             "role": "system",
                             "content": [{"type": "text", "text": SYSTEM_PROMPT}],
                         }
-                    ),
+                    ).decode(),
                     thread_id=thread_id,
                     user_id=message_data.user_id,
                 )
                 self.session.add(system_message)
-                self.session.commit()
                 thread = [system_message]
             else:
                 raise
 
-        thread.sort(key=lambda m: m.timestamp)
-        messages = [ContentMessage.model_validate_json(m.content) for m in thread]
+        messages = [_parse_content(m.id, m.content) for m in thread]
 
-        content_items = [{"type": "text", "text": message_data.content}]
+        # Built from trusted local data, so validation is skipped
+        content_items = [
+            TextContent.model_construct(type="text", text=message_data.content)
+        ]
         if form_pages is not None:
-            for page in form_pages:
-                if self._is_valid_base64_image(page):
-                    content_items.append(
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{page.decode('utf-8')}"
-                            },
-                        }
-                    )
-                else:
-                    continue
-
-        user_message = ContentMessage.model_validate_json(
-            json.dumps(
-                {
-                    "role": "user",
-                    "content": content_items,
-                }
+            # Validating and encoding large pages is CPU-bound; keep it off the loop
+            content_items += await asyncio.to_thread(
+                self._image_content_items, form_pages
             )
+
+        user_message = ContentMessage.model_construct(
+            role="user", content=content_items
         )
         messages.append(user_message)
 
-        # Add the user message to the session
         user_message_db = Message(
             content=user_message.model_dump_json(),
             thread_id=thread_id,
             user_id=message_data.user_id,
         )
         self.session.add(user_message_db)
-        self.session.commit()
 
-        _response = fastformbuild_chat(lm, messages)
+        # The system, user and assistant messages are committed together once the
+        # model has answered; a failed call leaves the thread untouched
+        replies, cached = await self._respond(
+            fastformbuild_chat,
+            lm,
+            messages,
+            [*(m.content for m in thread), user_message_db.content],
+        )
 
-        response = []
-        created_messages = []
-        for msg in _response:
-            new_message = Message(
-                content=msg.model_dump_json(),
+        created_messages = [
+            Message(
+                content=content,
                 thread_id=thread_id,
                 user_id=message_data.user_id,
             )
-            self.session.add(new_message)
-            created_messages.append(new_message)
+            for content in replies
+        ]
+        self.session.add_all(created_messages)
+        # Every column is set client-side and the IDs come back from the INSERT, so
+        # the committed rows need no refresh (the session does not expire on commit)
+        await self.session.commit()
 
-        self.session.commit()
-
-        for msg in created_messages:
-            self.session.refresh(msg)
-            response.append(msg)
-
-        return response
+        return created_messages, cached
 
 
 class FastfillMessageService(MessageService):
     """Service class for FastFill message-related operations."""
 
-    def __init__(self, session: Session):
-        super().__init__(session)
+    def __init__(
+        self,
+        session: AsyncSession,
+        llm_executor: Executor | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
+        super().__init__(session, llm_executor, response_cache)
         self.annotation_service = AnnotationService(session)
 
-    def chat(
+    async def chat(
         self,
         lm: Model,
         message_data: FastformBuildMessageCreate,
-    ) -> list[Message]:
+    ) -> tuple[list[Message], bool]:
         """Create a new FastformBuild chat message.
 
         Args:
@@ -427,11 +698,12 @@ class FastfillMessageService(MessageService):
             message_data: The data for the new message.
 
         Returns:
-            A list of messages.
+            The created assistant messages, and whether the model's reply was served
+            from the response cache.
         """
         thread_id = message_data.thread_id
-        annotation = (
-            self.annotation_service.get_annotation_by_id(
+        structure = (
+            await self.annotation_service.get_annotation_structure(
                 message_data.load_annotation_id
             )
             if message_data.load_annotation_id
@@ -439,46 +711,40 @@ class FastfillMessageService(MessageService):
         )
 
         try:
-            thread = self._get_thread_history(thread_id)
+            thread = await self._get_chat_history(thread_id)
         except HTTPException as e:
             if e.status_code == status.HTTP_404_NOT_FOUND:
                 system_message = Message(
-                    content=json.dumps(
+                    content=orjson.dumps(
                         {
                             "role": "system",
                             "content": [
                                 {
                                     "type": "text",
-                                    "text": SYSTEM_PROMPT_FILL.format(
-                                        form_structure=annotation.structure
-                                        if annotation
-                                        else "No structure provided"
+                                    "text": build_fill_system(
+                                        structure or "No structure provided"
                                     ),
                                 }
                             ],
                         }
-                    ),
+                    ).decode(),
                     thread_id=thread_id,
                     user_id=message_data.user_id,
                 )
                 self.session.add(system_message)
-                self.session.commit()
                 thread = [system_message]
             else:
                 raise
 
-        thread.sort(key=lambda m: m.timestamp)
-        messages = [ContentMessage.model_validate_json(m.content) for m in thread]
+        messages = [_parse_content(m.id, m.content) for m in thread]
 
-        content_items = [{"type": "text", "text": message_data.content}]
+        # Built from trusted local data, so validation is skipped
+        content_items = [
+            TextContent.model_construct(type="text", text=message_data.content)
+        ]
 
-        user_message = ContentMessage.model_validate_json(
-            json.dumps(
-                {
-                    "role": "user",
-                    "content": content_items,
-                }
-            )
+        user_message = ContentMessage.model_construct(
+            role="user", content=content_items
         )
         messages.append(user_message)
 
@@ -488,25 +754,27 @@ class FastfillMessageService(MessageService):
             user_id=message_data.user_id,
         )
         self.session.add(user_message_db)
-        self.session.commit()
 
-        _response = fastformfill_chat(lm, messages)
+        # The system, user and assistant messages are committed together once the
+        # model has answered; a failed call leaves the thread untouched
+        replies, cached = await self._respond(
+            fastformfill_chat,
+            lm,
+            messages,
+            [*(m.content for m in thread), user_message_db.content],
+        )
 
-        response = []
-        created_messages = []
-        for msg in _response:
-            new_message = Message(
-                content=msg.model_dump_json(),
+        created_messages = [
+            Message(
+                content=content,
                 thread_id=thread_id,
                 user_id=message_data.user_id,
             )
-            self.session.add(new_message)
-            created_messages.append(new_message)
-
-        self.session.commit()
-
-        for msg in created_messages:
-            self.session.refresh(msg)
-            response.append(msg)
-
-        return response
+            for content in replies
+        ]
+        self.session.add_all(created_messages)
+        # Every column is set client-side and the IDs come back from the INSERT, so
+        # the committed rows need no refresh (the session does not expire on commit)
+        await self.session.commit()
+
+        return created_messages, cached
@@ -9,126 +9,312 @@ This script provides comprehensive testing for all FastForm APIs in logical orde
 5. Error Handling & Edge Cases - Test various failure scenarios
 """
 
-import json
+import asyncio
+import functools
 import time
-import uuid
 import sys
 import os
 import base64
-import requests
-import pprint
+import httpx
+import orjson
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
-
-# Add parent directory to path for imports
-sys.path.append(os.path.abspath(os.path.join(os.getcwd(), "..")))
-
-try:
-    from app.config import APIKeys
-    import pymupdf
-except ImportError as e:
-    print(f"Warning: Could not import required modules: {e}")
-    print("Some tests may be skipped if dependencies are missing")
+from typing import Dict, Any, Callable, NamedTuple, Optional, Tuple, Union
 
 LOCAL_BASE_URL = "http://localhost:8000"
 PRODUCTION_BASE_URL = (
     "https://fastform.jollydune-3875217e.westus2.azurecontainerapps.io"
 )
 
-USE_PRODUCTION = False
-BASE_URL = PRODUCTION_BASE_URL if USE_PRODUCTION else LOCAL_BASE_URL
+# Set FASTFORM_BASE_URL (e.g. to PRODUCTION_BASE_URL) to test another deployment
+BASE_URL = os.environ.get("FASTFORM_BASE_URL", LOCAL_BASE_URL)
+
+API_ROOT = f"{BASE_URL}/v1"
+
+# Pretty-printed request/response bodies are only logged when asked for
+VERBOSE = os.environ.get("FASTFORM_TEST_VERBOSE", "0") == "1"
+
 
-print(f"Testing against: {BASE_URL}")
+# Random 8-hex-digit suffixes for the run, drawn from a single os.urandom read
+_RANDOM_HEX = os.urandom(64).hex()
+_ID_POOL = [_RANDOM_HEX[i : i + 8] for i in range(0, len(_RANDOM_HEX), 8)]
+
+
+def _unique_suffix() -> str:
+    """Take an unused random suffix from the pool"""
+    return _ID_POOL.pop()
 
 
 # Test data generators
 def generate_test_user_id():
     """Generate a unique test user ID"""
-    return f"test_user_{uuid.uuid4().hex[:8]}"
+    return f"test_user_{_unique_suffix()}"
 
 
 def generate_test_annotation_name():
     """Generate a unique test annotation name"""
-    return f"test_form_{uuid.uuid4().hex[:8]}"
+    return f"test_form_{_unique_suffix()}"
 
 
 # Common headers
 HEADERS = {"accept": "application/json", "Content-Type": "application/json"}
 
 
+# Resolved from this file so the script works from any working directory
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sample")
+SAMPLE_PDF_PATH = os.path.join(SAMPLE_DIR, "multiple-listing.pdf")
+SAMPLE_PAGE_CACHE_PATH = os.path.join(SAMPLE_DIR, "multiple-listing.page0.b64")
+
+
+@functools.cache
+def _load_form_page_b64() -> str:
+    """Return the first sample PDF page as base64 PNG, rendering it only once
+
+    The result is memoized for the process and also cached next to the PDF, so
+    later runs skip rasterization as well. The cache file is re-rendered whenever
+    the PDF is newer than it.
+    Half scale is plenty for the FastFormBuild smoke test and keeps the body small.
+    """
+    if os.path.exists(SAMPLE_PAGE_CACHE_PATH) and os.path.getmtime(
+        SAMPLE_PAGE_CACHE_PATH
+    ) >= os.path.getmtime(SAMPLE_PDF_PATH):
+        with open(SAMPLE_PAGE_CACHE_PATH, "rb") as f:
+            return f.read().decode("ascii")
+
+    # Only needed when the page is not cached yet, so imported here
+    import pymupdf
+
+    with pymupdf.open(SAMPLE_PDF_PATH) as doc:
+        pixmap = doc[0].get_pixmap(matrix=pymupdf.Matrix(0.5, 0.5), alpha=False)
+    # Stays PNG: the server wraps every page in a data:image/png URL
+    page_b64 = base64.b64encode(pixmap.tobytes("png"))
+
+    with open(SAMPLE_PAGE_CACHE_PATH, "wb") as f:
+        f.write(page_b64)
+    return page_b64.decode("ascii")
+
+
+def _truncate_pages(data: Dict) -> Dict:
+    """Shorten base64 form pages so logging a request does not dump whole images"""
+    if "form_pages" not in data:
+        return data
+    pages = [f"{page[:64]}..." for page in data["form_pages"]]
+    return {**data, "form_pages": pages}
+
+
 # Helper function for API calls
-def make_request(
+async def make_request(
+    client: httpx.AsyncClient,
     method: str,
     endpoint: str,
     data: Optional[Dict] = None,
     expected_status: Optional[int] = None,
 ) -> Tuple[int, Any]:
     """Make an API request and return response with error handling"""
-    url = f"{BASE_URL}/v1{endpoint}"
-    print(f"\n{method.upper()} {url}")
+    url = API_ROOT + endpoint
+    # Lines are collected and written in one go, so output from concurrent
+    # requests does not interleave and stdout is written once per call
+    method = method.upper()
+    log = [f"\n{method} {url}"]
+    try:
+        return await _send(client, method, url, data, expected_status, log)
+    finally:
+        sys.stdout.write("\n".join(log) + "\n")
+
 
-    if data:
-        print(f"Request Data: {json.dumps(data, indent=2)}")
+async def _send(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    data: Optional[Dict],
+    expected_status: Optional[int],
+    log: list[str],
+) -> Tuple[int, Any]:
+    """Send the request for make_request, appending its log lines to `log`"""
+    if VERBOSE and data:
+        log.append(
+            f"Request Data: {orjson.dumps(_truncate_pages(data), option=orjson.OPT_INDENT_2).decode()}"
+        )
 
-    if method.lower() == "get":
-        response = requests.get(url, headers=HEADERS)
-    elif method.lower() == "post":
-        response = requests.post(url, headers=HEADERS, json=data)
-    elif method.lower() == "put":
-        response = requests.put(url, headers=HEADERS, json=data)
-    elif method.lower() == "delete":
-        response = requests.delete(url, headers=HEADERS)
+    # Uvicorn drops the connection after an unhandled 500, which a concurrent call
+    # may already have picked up from the pool; idempotent calls get one retry
+    attempts = 1 if method == "POST" else 2
+    body = None if data is None else orjson.dumps(data)
+    for attempt in range(attempts):
+        try:
+            response = await client.request(method, url, content=body)
+            break
+        except httpx.TransportError as e:
+            if attempt + 1 == attempts:
+                log.append(f"Request failed: {e!r}")
+                return 0, None
 
-    print(f"Status: {response.status_code}")
+    log.append(f"Status: {response.status_code}")
 
     if expected_status and response.status_code != expected_status:
-        print(f"Expected status {expected_status}, got {response.status_code}")
+        log.append(f"Expected status {expected_status}, got {response.status_code}")
     elif expected_status and response.status_code == expected_status:
-        print(f"Status matches expected {expected_status}")
+        log.append(f"Status matches expected {expected_status}")
+
+    # DELETEs answer 204 with no body, so there is nothing to parse
+    if response.status_code == 204 or not response.content:
+        return response.status_code, None
 
     try:
-        response_data = response.json()
-        print(f"Response: {json.dumps(response_data, indent=2)}")
+        response_data = orjson.loads(response.content)
+        if VERBOSE:
+            log.append(
+                f"Response: {orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode()}"
+            )
         return response.status_code, response_data
     except Exception as e:
-        print(f"Response: {response.text}, {e}")
+        if VERBOSE:
+            log.append(f"Response: {response.text}, {e}")
         return response.status_code, response.text
 
 
+class Check(NamedTuple):
+    """A request judged only by its status code and checks on the response body
+
+    `endpoint` is a fixed path or, like `payload`, a function of the tester so checks
+    can use created resources.
+    """
+
+    name: str
+    method: str
+    endpoint: Union[str, Callable[["FastFormAPITester"], str]]
+    expected_status: int
+    payload: Optional[Callable[["FastFormAPITester"], Dict]] = None
+    validators: Tuple[Callable[["FastFormAPITester", Any], bool], ...] = ()
+
+
+def _is_list(tester: "FastFormAPITester", response: Any) -> bool:
+    return isinstance(response, list)
+
+
+# Checks that need no created resources
+INDEPENDENT_CHECKS = (
+    Check(
+        "API Root Endpoint",
+        "GET",
+        "/",
+        200,
+        validators=(lambda t, r: "FastForm API" in str(r),),
+    ),
+    Check(
+        "Non-existent User Retrieval",
+        "GET",
+        "/user/non_existent_user_12345",
+        404,
+    ),
+    Check(
+        "Non-existent Annotation Retrieval",
+        "GET",
+        "/annotation/99999",
+        404,
+    ),
+    # Missing the required 'id' field
+    Check(
+        "Invalid User Creation",
+        "POST",
+        "/user",
+        422,
+        payload=lambda t: {"email": "invalid@example.com"},
+    ),
+)
+
+FASTFORMBUILD_THREAD_CHECKS = (
+    Check(
+        "Get FastFormBuild Threads",
+        "GET",
+        lambda t: f"/fastformbuild/threads/{t.created_user_id}",
+        200,
+        validators=(_is_list,),
+    ),
+    Check(
+        "Get FastFormBuild Thread History",
+        "GET",
+        lambda t: f"/fastformbuild/threads/{t.fastformbuild_thread_id}/history",
+        200,
+        validators=(_is_list,),
+    ),
+)
+
+FASTFILL_THREAD_CHECKS = (
+    Check(
+        "Get FastFill Threads",
+        "GET",
+        lambda t: f"/fastfill/threads/{t.created_user_id}",
+        200,
+        validators=(_is_list,),
+    ),
+    Check(
+        "Get FastFill Thread History",
+        "GET",
+        lambda t: f"/fastfill/threads/{t.fastfill_thread_id}/history",
+        200,
+        validators=(_is_list,),
+    ),
+)
+
+VERIFY_ANNOTATION_DELETION = Check(
+    "Verify Annotation Deletion",
+    "GET",
+    lambda t: f"/annotation/{t.created_annotation_id}",
+    404,
+)
+
+VERIFY_USER_DELETION = Check(
+    "Verify User Deletion",
+    "GET",
+    lambda t: f"/user/{t.created_user_id}",
+    404,
+)
+
+
 class FastFormAPITester:
     """Comprehensive API testing class for FastForm"""
 
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
         self.created_user_id = None
         self.created_annotation_id = None
         self.fastformbuild_thread_id = None
         self.fastfill_thread_id = None
-        self.test_results = []
+        # (test_name, success, details, timestamp_ns) per logged result
+        self.test_results: list[tuple[str, bool, str, int]] = []
+        self.passed_tests = 0
+        self.failed_tests = 0
 
     def log_test_result(self, test_name: str, success: bool, details: str = ""):
         """Log test results"""
-        result = {
-            "test_name": test_name,
-            "success": success,
-            "details": details,
-            "timestamp": datetime.now().isoformat(),
-        }
-        self.test_results.append(result)
+        self.test_results.append((test_name, success, details, time.time_ns()))
+        if success:
+            self.passed_tests += 1
+        else:
+            self.failed_tests += 1
         status = "PASS" if success else "FAIL"
         print(f"{status}: {test_name}")
         if details:
             print(f"  Details: {details}")
 
-    def test_api_root(self):
-        """Test API Root Endpoint"""
-        print("\nTesting API Root Endpoint")
-
-        status, response = make_request("GET", "/", expected_status=200)
-        success = status == 200 and "FastForm API" in str(response)
-        self.log_test_result("API Root Endpoint", success)
+    async def _run(self, check: Check) -> bool:
+        """Run a single Check and log its result"""
+        payload = check.payload(self) if check.payload else None
+        endpoint = check.endpoint
+        status, response = await make_request(
+            self.client,
+            check.method,
+            endpoint(self) if callable(endpoint) else endpoint,
+            payload,
+            expected_status=check.expected_status,
+        )
+        success = status == check.expected_status and all(
+            validator(self, response) for validator in check.validators
+        )
+        self.log_test_result(check.name, success)
         return success
 
-    def test_user_management(self):
+    async def test_user_management(self):
         """Test User Management APIs"""
         print("\nTesting User Management APIs")
 
@@ -137,7 +323,9 @@ class FastFormAPITester:
         test_user_id = generate_test_user_id()
         user_data = {"id": test_user_id, "email": f"{test_user_id}@example.com"}
 
-        status, response = make_request("POST", "/user", user_data, expected_status=201)
+        status, response = await make_request(
+            self.client, "POST", "/user", user_data, expected_status=201
+        )
         success = (
             status == 201
             and response.get("id") == test_user_id
@@ -153,8 +341,8 @@ class FastFormAPITester:
 
         # 1.2 Get User API Test
         print("Testing User Retrieval")
-        status, response = make_request(
-            "GET", f"/user/{self.created_user_id}", expected_status=200
+        status, response = await make_request(
+            self.client, "GET", f"/user/{self.created_user_id}", expected_status=200
         )
         success = (
             status == 200
@@ -168,8 +356,12 @@ class FastFormAPITester:
         updated_email = f"updated_{self.created_user_id}@example.com"
         update_data = {"id": self.created_user_id, "email": updated_email}
 
-        status, response = make_request(
-            "PUT", f"/user/{self.created_user_id}", update_data, expected_status=200
+        status, response = await make_request(
+            self.client,
+            "PUT",
+            f"/user/{self.created_user_id}",
+            update_data,
+            expected_status=200,
         )
         success = (
             status == 200
@@ -180,7 +372,7 @@ class FastFormAPITester:
 
         return True
 
-    def test_annotation_management(self):
+    async def test_annotation_management(self):
         """Test Annotation Management APIs"""
         print("\nTesting Annotation Management APIs")
 
@@ -222,12 +414,12 @@ class FastFormAPITester:
         annotation_data = {
             "name": annotation_name,
             "description": "Test annotation for API testing",
-            "structure": json.dumps(sample_form_structure),
+            "structure": orjson.dumps(sample_form_structure).decode(),
             "user_id": self.created_user_id,
         }
 
-        status, response = make_request(
-            "POST", "/annotation", annotation_data, expected_status=201
+        status, response = await make_request(
+            self.client, "POST", "/annotation", annotation_data, expected_status=201
         )
         success = (
             status == 201
@@ -244,8 +436,11 @@ class FastFormAPITester:
 
         # 2.2 Get Annotation API Test
         print("Testing Annotation Retrieval")
-        status, response = make_request(
-            "GET", f"/annotation/{self.created_annotation_id}", expected_status=200
+        status, response = await make_request(
+            self.client,
+            "GET",
+            f"/annotation/{self.created_annotation_id}",
+            expected_status=200,
         )
         success = (
             status == 200
@@ -256,52 +451,59 @@ class FastFormAPITester:
 
         # 2.3 List Annotations by User API Test
         print("Testing Annotation Listing by User")
-        status, response = make_request(
-            "GET", f"/annotation?user_id={self.created_user_id}", expected_status=200
+        status, response = await make_request(
+            self.client,
+            "GET",
+            f"/annotation?user_id={self.created_user_id}",
+            expected_status=200,
         )
         success = status == 200 and isinstance(response, list) and len(response) >= 1
         self.log_test_result("List Annotations by User", success)
 
-        # 2.4 Update Annotation API Test (Known to have issues)
+        # 2.4 Update Annotation API Test
         print("Testing Annotation Update")
         updated_name = f"updated_{annotation_name}"
         updated_description = "Updated test annotation description"
 
-        updated_structure = sample_form_structure.copy()
-        updated_structure["elements"].append(
-            {
-                "title": "Phone Number",
-                "description": "User's phone number",
-                "bbox": [{"x": None, "y": None}, {"x": None, "y": None}],
-                "element_name": "PhoneField",
-                "value": None,
-            }
-        )
+        # A new elements list, so sample_form_structure itself is left untouched
+        updated_structure = {
+            **sample_form_structure,
+            "elements": [
+                *sample_form_structure["elements"],
+                {
+                    "title": "Phone Number",
+                    "description": "User's phone number",
+                    "bbox": [{"x": None, "y": None}, {"x": None, "y": None}],
+                    "element_name": "PhoneField",
+                    "value": None,
+                },
+            ],
+        }
 
         update_data = {
             "id": self.created_annotation_id,
             "name": updated_name,
             "description": updated_description,
-            "structure": json.dumps(updated_structure),
+            "structure": orjson.dumps(updated_structure).decode(),
         }
 
-        status, response = make_request(
+        status, response = await make_request(
+            self.client,
             "PUT",
             f"/annotation/{self.created_annotation_id}",
             update_data,
             expected_status=200,
         )
-        # Note: This is known to fail with 500 error due to service method signature issue
-        success = status == 200
-        self.log_test_result(
-            "Update Annotation",
-            success,
-            "Known issue: Service method signature mismatch causes 500 error",
+        success = (
+            status == 200
+            and response.get("name") == updated_name
+            and response.get("description") == updated_description
         )
+        self.log_test_result("Update Annotation", success)
 
         return True
 
-    def test_fastformbuild_apis(self):
+    async def test_fastformbuild_apis(self):
         """Test FastFormBuild APIs"""
         print("\nTesting FastFormBuild APIs")
 
@@ -313,18 +515,13 @@ class FastFormAPITester:
         print("Testing FastFormBuild Chat with Form Image")
 
         try:
-            # Load and process the form image
-            doc = pymupdf.open("../sample/multiple-listing.pdf")
-            page = doc[0]
-            page_bytes = page.get_pixmap().tobytes()
-            page_b64 = base64.b64encode(page_bytes).decode("utf-8")
-            doc.close()
+            page_b64 = _load_form_page_b64()
         except Exception as e:
             print(f"Warning: Could not load PDF file: {e}")
             # Use a dummy base64 string for testing
             page_b64 = "dummy_base64_string_for_testing"
 
-        self.fastformbuild_thread_id = f"test_thread_{uuid.uuid4().hex[:8]}"
+        self.fastformbuild_thread_id = f"test_thread_{_unique_suffix()}"
         fastformbuild_data = {
             "message_data": {
                 "thread_id": self.fastformbuild_thread_id,
@@ -334,8 +531,12 @@ class FastFormAPITester:
             "form_pages": [page_b64],
         }
 
-        status, response = make_request(
-            "POST", "/fastformbuild/chat", fastformbuild_data, expected_status=200
+        status, response = await make_request(
+            self.client,
+            "POST",
+            "/fastformbuild/chat",
+            fastformbuild_data,
+            expected_status=200,
         )
         success = (
             status == 200
@@ -352,8 +553,18 @@ class FastFormAPITester:
             )
             print(f"Message ID: {response['id']}")
 
-        # 3.2 FastFormBuild Follow-up Chat (without image)
-        print("Testing FastFormBuild Follow-up Chat")
+        # 3.2 - 3.4 only need the thread ID, so the follow-up chat, thread listing and
+        # history run concurrently
+        print("Testing FastFormBuild Follow-up Chat, Thread Listing and History")
+        await asyncio.gather(
+            self._test_fastformbuild_followup(),
+            *(self._run(check) for check in FASTFORMBUILD_THREAD_CHECKS),
+        )
+
+        return True
+
+    async def _test_fastformbuild_followup(self):
+        """FastFormBuild Follow-up Chat (without image)"""
         followup_data = {
             "message_data": {
                 "thread_id": self.fastformbuild_thread_id,
@@ -362,8 +573,12 @@ class FastFormAPITester:
             }
         }
 
-        status, response = make_request(
-            "POST", "/fastformbuild/chat", followup_data, expected_status=200
+        status, response = await make_request(
+            self.client,
+            "POST",
+            "/fastformbuild/chat",
+            followup_data,
+            expected_status=200,
         )
         success = (
             status == 200
@@ -372,36 +587,7 @@ class FastFormAPITester:
         )
         self.log_test_result("FastFormBuild Follow-up Chat", success)
 
-        # 3.3 Get FastFormBuild Threads by User
-        print("Testing FastFormBuild Thread Listing")
-        status, response = make_request(
-            "GET", f"/fastformbuild/threads/{self.created_user_id}", expected_status=200
-        )
-        success = status == 200 and isinstance(response, list)
-        self.log_test_result("Get FastFormBuild Threads", success)
-
-        if success:
-            print(f"Found {len(response)} thread(s) for user {self.created_user_id}")
-
-        # 3.4 Get FastFormBuild Thread History
-        print("Testing FastFormBuild Thread History")
-        if self.fastformbuild_thread_id:
-            status, response = make_request(
-                "GET",
-                f"/fastformbuild/threads/{self.fastformbuild_thread_id}/history",
-                expected_status=200,
-            )
-            success = status == 200 and isinstance(response, list)
-            self.log_test_result("Get FastFormBuild Thread History", success)
-
-            if success:
-                print(
-                    f"Found {len(response)} message(s) in thread {self.fastformbuild_thread_id}"
-                )
-
-        return True
-
-    def test_fastfill_apis(self):
+    async def test_fastfill_apis(self):
         """Test FastFill APIs"""
         print("\nTesting FastFill APIs")
 
@@ -411,7 +597,7 @@ class FastFormAPITester:
 
         # 4.1 FastFill Chat API Test
         print("Testing FastFill Chat")
-        self.fastfill_thread_id = f"fastfill_thread_{uuid.uuid4().hex[:8]}"
+        self.fastfill_thread_id = f"fastfill_thread_{_unique_suffix()}"
         fastfill_data = {
             "content": "Please fill this form with sample data: Name: John Doe, Email: john.doe@example.com, Message: Hello, this is a test message for the contact form.",
             "thread_id": self.fastfill_thread_id,
@@ -419,8 +605,8 @@ class FastFormAPITester:
             "load_annotation_id": self.created_annotation_id,
         }
 
-        status, response = make_request(
-            "POST", "/fastfill/chat", fastfill_data, expected_status=200
+        status, response = await make_request(
+            self.client, "POST", "/fastfill/chat", fastfill_data, expected_status=200
         )
         success = (
             status == 200
@@ -435,67 +621,18 @@ class FastFormAPITester:
             print(f"FastFill chat successful, thread: {self.fastfill_thread_id}")
             print(f"Message ID: {response['id']}")
 
-        # 4.2 Get FastFill Threads by User
-        print("Testing FastFill Thread Listing")
-        status, response = make_request(
-            "GET", f"/fastfill/threads/{self.created_user_id}", expected_status=200
-        )
-        success = status == 200 and isinstance(response, list)
-        self.log_test_result("Get FastFill Threads", success)
-
-        if success:
-            print(
-                f"Found {len(response)} FastFill thread(s) for user {self.created_user_id}"
-            )
-
-        # 4.3 Get FastFill Thread History
-        print("Testing FastFill Thread History")
-        if self.fastfill_thread_id:
-            status, response = make_request(
-                "GET",
-                f"/fastfill/threads/{self.fastfill_thread_id}/history",
-                expected_status=200,
-            )
-            success = status == 200 and isinstance(response, list)
-            self.log_test_result("Get FastFill Thread History", success)
-
-            if success:
-                print(
-                    f"Found {len(response)} message(s) in FastFill thread {self.fastfill_thread_id}"
-                )
+        # 4.2 / 4.3 Thread listing and history
+        print("Testing FastFill Thread Listing and History")
+        for check in FASTFILL_THREAD_CHECKS:
+            await self._run(check)
 
         return True
 
-    def test_error_handling(self):
+    async def test_error_handling(self):
         """Test Error Handling & Edge Cases"""
         print("\nTesting Error Handling & Edge Cases")
 
-        # 5.1 Test Non-existent User Retrieval
-        print("Testing Non-existent User Retrieval")
-        non_existent_user_id = "non_existent_user_12345"
-        status, response = make_request(
-            "GET", f"/user/{non_existent_user_id}", expected_status=404
-        )
-        success = status == 404
-        self.log_test_result("Non-existent User Retrieval", success)
-
-        # 5.2 Test Non-existent Annotation Retrieval
-        print("Testing Non-existent Annotation Retrieval")
-        non_existent_annotation_id = 99999
-        status, response = make_request(
-            "GET", f"/annotation/{non_existent_annotation_id}", expected_status=404
-        )
-        success = status == 404
-        self.log_test_result("Non-existent Annotation Retrieval", success)
-
-        # 5.3 Test Invalid User Creation (missing required fields)
-        print("Testing Invalid User Creation")
-        invalid_user_data = {"email": "invalid@example.com"}  # Missing 'id' field
-        status, response = make_request(
-            "POST", "/user", invalid_user_data, expected_status=422
-        )
-        success = status == 422
-        self.log_test_result("Invalid User Creation", success)
+        # 5.1 - 5.3 need no created resources and run up front in run_all_tests
 
         # 5.4 Test Duplicate User Creation
         print("Testing Duplicate User Creation")
@@ -504,22 +641,23 @@ class FastFormAPITester:
                 "id": self.created_user_id,  # This user already exists
                 "email": "duplicate@example.com",
             }
-            status, response = make_request(
-                "POST", "/user", duplicate_user_data, expected_status=400
+            status, response = await make_request(
+                self.client, "POST", "/user", duplicate_user_data, expected_status=400
             )
             success = status in [400, 409]
             self.log_test_result("Duplicate User Creation", success)
 
         return True
 
-    def cleanup(self):
+    async def cleanup(self):
         """Cleanup created resources"""
         print("\nCleanup - Deleting Created Resources")
 
         # Delete Annotation
         if self.created_annotation_id:
             print("Testing Annotation Deletion")
-            status, response = make_request(
+            status, response = await make_request(
+                self.client,
                 "DELETE",
                 f"/annotation/{self.created_annotation_id}",
                 expected_status=204,
@@ -529,19 +667,16 @@ class FastFormAPITester:
 
             # Verify annotation is deleted
             if success:
-                status, response = make_request(
-                    "GET",
-                    f"/annotation/{self.created_annotation_id}",
-                    expected_status=404,
-                )
-                success = status == 404
-                self.log_test_result("Verify Annotation Deletion", success)
+                await self._run(VERIFY_ANNOTATION_DELETION)
 
         # Delete User (Known to have issues)
         if self.created_user_id:
             print("Testing User Deletion")
-            status, response = make_request(
-                "DELETE", f"/user/{self.created_user_id}", expected_status=204
+            status, response = await make_request(
+                self.client,
+                "DELETE",
+                f"/user/{self.created_user_id}",
+                expected_status=204,
             )
             # Note: This is known to fail with 500 error due to foreign key constraints
             success = status == 204
@@ -553,11 +688,7 @@ class FastFormAPITester:
 
             # Verify user is deleted
             if success:
-                status, response = make_request(
-                    "GET", f"/user/{self.created_user_id}", expected_status=404
-                )
-                success = status == 404
-                self.log_test_result("Verify User Deletion", success)
+                await self._run(VERIFY_USER_DELETION)
 
     def print_summary(self):
         """Print test summary"""
@@ -565,9 +696,9 @@ class FastFormAPITester:
         print("FASTFORM API TEST SUMMARY")
         print("=" * 60)
 
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result["success"])
-        failed_tests = total_tests - passed_tests
+        passed_tests = self.passed_tests
+        failed_tests = self.failed_tests
+        total_tests = passed_tests + failed_tests
 
         print(f"Total Tests: {total_tests}")
         print(f"Passed: {passed_tests}")
@@ -575,19 +706,19 @@ class FastFormAPITester:
         print(f"Success Rate: {(passed_tests / total_tests) * 100:.1f}%")
 
         print("\nDetailed Results:")
-        for result in self.test_results:
-            status = "PASS" if result["success"] else "FAIL"
-            print(f"  {status}: {result['test_name']}")
-            if result["details"]:
-                print(f"    Note: {result['details']}")
+        for test_name, success, details, timestamp_ns in self.test_results:
+            status = "PASS" if success else "FAIL"
+            timestamp = datetime.fromtimestamp(timestamp_ns / 1e9)
+            print(
+                f"  {status}: {test_name} "
+                f"({timestamp.isoformat(timespec='milliseconds')})"
+            )
+            if details:
+                print(f"    Note: {details}")
 
         print("\nKnown Issues:")
         print(
-            "  1. Annotation Update API (PUT /v1/annotation/{id}) - 500 Internal Server Error"
-        )
-        print("     Cause: Service method signature mismatch")
-        print(
-            "  2. User Deletion API (DELETE /v1/user/{id}) - 500 Internal Server Error"
+            "  1. User Deletion API (DELETE /v1/user/{id}) - 500 Internal Server Error"
         )
         print("     Cause: Foreign key constraint violation when user has messages")
 
@@ -599,27 +730,39 @@ class FastFormAPITester:
         else:
             print("  NEEDS ATTENTION: Multiple critical issues found")
 
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all tests in sequence"""
         print("Starting FastForm API Test Suite")
         print(f"Testing against: {BASE_URL}")
 
-        # Run tests in logical order
-        self.test_api_root()
-        self.test_user_management()
-        self.test_annotation_management()
-        self.test_fastformbuild_apis()
-        self.test_fastfill_apis()
-        self.test_error_handling()
-        self.cleanup()
+        # Checks that need no created resources run concurrently up front
+        print("\nTesting API Root Endpoint and Resource-free Error Cases")
+        await asyncio.gather(*(self._run(check) for check in INDEPENDENT_CHECKS))
+
+        # The remaining tests build on each other, so they run in logical order
+        await self.test_user_management()
+        await self.test_annotation_management()
+        await self.test_fastformbuild_apis()
+        await self.test_fastfill_apis()
+        await self.test_error_handling()
+        await self.cleanup()
         self.print_summary()
 
 
-def main():
+async def main():
     """Main function to run the test suite"""
-    tester = FastFormAPITester()
-    tester.run_all_tests()
+    # One pooled client for the whole run, so connections are reused across tests.
+    # Over HTTPS (production ingress) concurrent calls multiplex on HTTP/2 streams;
+    # plain-HTTP local runs negotiate HTTP/1.1 as before.
+    async with httpx.AsyncClient(
+        headers=HEADERS,
+        http2=True,
+        timeout=None,
+        limits=httpx.Limits(max_connections=32, keepalive_expiry=60),
+    ) as client:
+        tester = FastFormAPITester(client)
+        await tester.run_all_tests()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())